@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import json
 import os
+import re
+import selectors
 import shutil
+import socket
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import traceback
@@ -23,27 +32,208 @@ CONFIG_DIR = Path.home() / ".config" / "arch-soundpad"
 CONFIG_FILE = CONFIG_DIR / "clips.json"
 SETTINGS_FILE = CONFIG_DIR / "settings.json"
 BACKUP_DIR = CONFIG_DIR / "backups"
+PROFILES_DIR = CONFIG_DIR / "profiles"
+PROFILE_INDEX_FILE = PROFILES_DIR / "index.json"
 SINK_NAME = "soundpad_sink"
 SOURCE_NAME = "soundpad_mic"
+PACTL = shutil.which("pactl")
+TK_MODIFIER_BITS = {"shift": 0x0001, "control": 0x0004, "alt": 0x0008, "super": 0x0040}
+HOTKEY_MODIFIER_ALIASES = {
+    "ctrl": "control",
+    "control": "control",
+    "alt": "alt",
+    "shift": "shift",
+    "super": "super",
+    "win": "super",
+    "mod4": "super",
+}
+TK_SEQUENCE_MODIFIERS = {"control": "Control", "alt": "Alt", "shift": "Shift", "super": "Mod4"}
+TK_MODIFIER_MASK = 0x0001 | 0x0004 | 0x0008 | 0x0040
+PACTL_LIST_TTL = 5.0
+SAVE_DEBOUNCE_MS = 300
+BACKUP_INTERVAL = 300.0
+MAX_BACKUPS = 50
+HOTKEY_REBIND_MS = 100
+HOTKEY_EVENT_BATCH = 32
+HOTKEY_REPEAT_WINDOW_MS = 20
+MPV_CONNECT_TIMEOUT = 2.0
+PLAYER_STDERR_LINES = 100
+DEFAULT_HOTKEY_CANDIDATES = tuple((f"Alt+{i}", f"alt+{i}") for i in range(1, 10))
+STREAM_RATE = 48000
+STREAM_CHANNELS = 2
+STREAM_BUFFER_MS = 50
+FFMPEG_ARGS_HEAD = ("-nostdin", "-hide_banner", "-loglevel", "error", "-y")
+FFMPEG_ARGS_LOOP = ("-stream_loop", "-1")
+FFMPEG_ARGS_TAIL = ("-f", "pulse", "-device", SINK_NAME, "out")
+INFO_TEXT = (
+    "Shortcuts:\n"
+    "  Enter: Play\n"
+    "  Delete: Remove\n"
+    "  Alt+\\: Stop\n"
+    "  Set per-clip key: Set Hotkey\n"
+    "  If Alt+1 fails in dwm, use Ctrl+Alt+1"
+)
+SOURCE_HINT = f"Set input device in apps to:\n{SOURCE_NAME}"
+AUDIO_FILETYPES = (
+    ("Audio files", "*.wav *.mp3 *.flac *.ogg *.m4a *.aac *.opus"),
+    ("All files", "*.*"),
+)
+_PACTL_ROW = re.compile(r"^(\d+)\t([^\t\n]+)\t([^\t\n]*)", re.M)
+PACTL_ENV_KEYS = (
+    "PATH",
+    "HOME",
+    "XDG_RUNTIME_DIR",
+    "DISPLAY",
+    "XAUTHORITY",
+    "DBUS_SESSION_BUS_ADDRESS",
+)
+PACTL_EVENT_KEYS = {
+    "module": (PACTL, "list", "short", "modules"),
+    "source": (PACTL, "list", "short", "sources"),
+    "sink": (PACTL, "list", "short", "sinks"),
+    "server": (PACTL, "info"),
+}
 
 try:
     from Xlib import X, XK, display as xdisplay
     from Xlib import error as xerror
 
     XLIB_AVAILABLE = True
+    GRAB_LOCK_VARIANTS = (0, X.LockMask, X.Mod2Mask, X.LockMask | X.Mod2Mask)
+    MOD_STATE_MASK = X.ShiftMask | X.ControlMask | X.Mod1Mask | X.Mod4Mask
 except Exception:
     XLIB_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pulsectl
+
+    PULSECTL_AVAILABLE = True
+except Exception:
+    PULSECTL_AVAILABLE = False
+
+
+def _dump_json(data):
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_json(raw):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# umask can only be read by setting it, so do that once before any threads start.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextlib.contextmanager
+def _atomic_open(path, mode="wb"):
+    path = Path(path)
+    fh = tempfile.NamedTemporaryFile(mode=mode, dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+    try:
+        with fh:
+            yield fh
+            fh.flush()
+            try:
+                file_mode = os.stat(path).st_mode & 0o7777
+            except FileNotFoundError:
+                file_mode = 0o666 & ~_UMASK
+            os.fchmod(fh.fileno(), file_mode)
+            os.fsync(fh.fileno())
+        os.replace(fh.name, path)
+    except BaseException:
+        try:
+            os.unlink(fh.name)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write(path, payload):
+    with _atomic_open(path) as fh:
+        fh.write(payload)
+
+
+@functools.lru_cache(maxsize=4096)
+def _clip_stem(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _as_str(value):
+    return value if isinstance(value, str) else "" if value is None else str(value)
+
+
+def _payload_digest(payload):
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def _profile_filename(name):
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("._") or "profile"
+    suffix = hashlib.blake2b(name.encode("utf-8"), digest_size=4).hexdigest()
+    return f"{slug[:48]}-{suffix}.json"
+
+
+_SPECIAL_KEYS = {
+    "\\": "backslash",
+    "/": "slash",
+    "-": "minus",
+    "=": "equal",
+    "`": "grave",
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _index_modules(listing):
+    modules = {}
+    for mod_id, mod_name, mod_args in _PACTL_ROW.findall(listing):
+        modules.setdefault(mod_name, []).append((mod_id, mod_args))
+    return modules
+
+
+@functools.lru_cache(maxsize=256)
+def parse_hotkey(hotkey_text):
+    raw = hotkey_text.strip()
+    if not raw:
+        return None
+    parts = [p.strip() for p in raw.split("+") if p.strip()]
+    if not parts:
+        return None
+    key_name = parts[-1].lower()
+    mods = set()
+    for mod in parts[:-1]:
+        canonical = HOTKEY_MODIFIER_ALIASES.get(mod.lower())
+        if canonical is None:
+            return None
+        mods.add(canonical)
+    return frozenset(mods), key_name
+
 
 class GlobalHotkeyManager:
-    def __init__(self, on_trigger):
+    def __init__(self, on_trigger, tk_root=None):
         self.on_trigger = on_trigger
+        self.tk_root = tk_root
+        self.file_handler_fd = None
         self.display = None
         self.root = None
         self.running = False
         self.thread = None
         self.bindings = {}
         self.registered = []
+        self._registered_actions = None
+        self._last_conflicts = []
+        self._keycode_cache = {}
+        self._wake_r = None
+        self._wake_w = None
 
     def _modifier_mask(self, mods):
         mask = 0
@@ -58,67 +248,90 @@ class GlobalHotkeyManager:
         return mask
 
     def _keysym_to_keycode(self, key_name):
-        special = {
-            "\\": "backslash",
-            "/": "slash",
-            "-": "minus",
-            "=": "equal",
-            "`": "grave",
-        }
-        key_name = special.get(key_name, key_name)
-        if key_name.startswith("f") and key_name[1:].isdigit():
-            key_name = key_name.upper()
-        keysym = XK.string_to_keysym(key_name)
-        if not keysym:
-            return None
-        keycode = self.display.keysym_to_keycode(keysym)
-        return keycode or None
+        if key_name in self._keycode_cache:
+            return self._keycode_cache[key_name]
+        lookup = _SPECIAL_KEYS.get(key_name, key_name)
+        if lookup.startswith("f") and lookup[1:].isdigit():
+            lookup = lookup.upper()
+        keysym = XK.string_to_keysym(lookup)
+        keycode = (self.display.keysym_to_keycode(keysym) or None) if keysym else None
+        self._keycode_cache[key_name] = keycode
+        return keycode
 
     def _hotkey_to_parts(self, hotkey_text):
-        raw = hotkey_text.strip()
-        if not raw:
-            return None
-        parts = [p.strip() for p in raw.split("+") if p.strip()]
-        if not parts:
-            return None
-        key_name = parts[-1].lower()
-        mods = set()
-        for mod in parts[:-1]:
-            lower = mod.lower()
-            if lower in ("ctrl", "control"):
-                mods.add("control")
-            elif lower == "alt":
-                mods.add("alt")
-            elif lower == "shift":
-                mods.add("shift")
-            elif lower in ("super", "win", "mod4"):
-                mods.add("super")
-            else:
-                return None
-        return mods, key_name
+        return parse_hotkey(hotkey_text)
 
     def start(self):
         if not XLIB_AVAILABLE or self.running:
             return False
         try:
             self.display = xdisplay.Display()
+            self._keycode_cache.clear()
             self.root = self.display.screen().root
+            if self.tk_root is not None and hasattr(self.tk_root.tk, "createfilehandler"):
+                fd = self.display.fileno()
+                self.tk_root.tk.createfilehandler(fd, tk.READABLE, self._on_display_readable)
+                self.file_handler_fd = fd
+                self.running = True
+                return True
+            self._wake_r, self._wake_w = os.pipe()
             self.running = True
             self.thread = threading.Thread(target=self._loop, daemon=True)
             self.thread.start()
             return True
         except Exception:
+            self._remove_file_handler()
+            self._close_wake_pipe()
             self.display = None
             self.root = None
             self.running = False
             return False
 
+    def _remove_file_handler(self):
+        if self.file_handler_fd is None:
+            return
+        try:
+            self.tk_root.tk.deletefilehandler(self.file_handler_fd)
+        except Exception:
+            pass
+        self.file_handler_fd = None
+
+    def _on_display_readable(self, _fd=None, _mask=None):
+        if not self.running or not self.display:
+            return
+        try:
+            more = self._drain_events()
+        except Exception:
+            return
+        if more:
+            # Only socket data wakes the file handler, so finish xlib's buffer
+            # from an idle callback.
+            self.tk_root.after_idle(self._on_display_readable)
+
+    def _close_wake_pipe(self):
+        for fd in (self._wake_r, self._wake_w):
+            if fd is None:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_r = None
+        self._wake_w = None
+
     def stop(self):
         if not self.running:
             return
         self.running = False
+        self._remove_file_handler()
+        try:
+            os.write(self._wake_w, b"\0")
+        except (OSError, TypeError):
+            pass
         if self.thread:
             self.thread.join(timeout=0.5)
+            self.thread = None
+        self._close_wake_pipe()
         self._unregister_all()
         try:
             if self.display:
@@ -128,7 +341,7 @@ class GlobalHotkeyManager:
         self.display = None
         self.root = None
 
-    def _unregister_all(self):
+    def _unregister_all(self, flush=True):
         if not self.display or not self.root:
             return
         for keycode, mask in self.registered:
@@ -137,6 +350,9 @@ class GlobalHotkeyManager:
             except Exception:
                 pass
         self.registered.clear()
+        self._registered_actions = None
+        if not flush:
+            return
         try:
             self.display.flush()
         except Exception:
@@ -145,10 +361,14 @@ class GlobalHotkeyManager:
     def register(self, hotkey_actions):
         if not self.running or not self.display or not self.root:
             return []
-        self._unregister_all()
+        actions = tuple(hotkey_actions)
+        if actions == self._registered_actions:
+            return list(self._last_conflicts)
+        self._unregister_all(flush=False)
         self.bindings = {}
         conflicts = []
-        for action, hotkey in hotkey_actions:
+        pending = []
+        for action, hotkey in actions:
             parsed = self._hotkey_to_parts(hotkey)
             if not parsed:
                 continue
@@ -158,42 +378,97 @@ class GlobalHotkeyManager:
                 conflicts.append(hotkey)
                 continue
             base_mask = self._modifier_mask(mods)
-            any_grab = False
-            for extra in (0, X.LockMask, X.Mod2Mask, X.LockMask | X.Mod2Mask):
+            grabs = []
+            for extra in GRAB_LOCK_VARIANTS:
                 mask = base_mask | extra
+                catcher = xerror.CatchError()
                 try:
-                    self.root.grab_key(keycode, mask, True, X.GrabModeAsync, X.GrabModeAsync)
-                    self.display.sync()
-                    self.registered.append((keycode, mask))
-                    any_grab = True
-                except xerror.BadAccess:
-                    continue
+                    self.root.grab_key(keycode, mask, True, X.GrabModeAsync, X.GrabModeAsync, onerror=catcher)
                 except Exception:
                     continue
-            if any_grab:
-                self.bindings[(keycode, base_mask)] = action
-            else:
-                conflicts.append(hotkey)
+                grabs.append((mask, catcher))
+            pending.append((action, hotkey, keycode, base_mask, grabs))
         try:
-            self.display.flush()
+            self.display.sync()
         except Exception:
             pass
-        return conflicts
+        for action, hotkey, keycode, base_mask, grabs in pending:
+            any_grab = False
+            for mask, catcher in grabs:
+                if catcher.get_error() is None:
+                    self.registered.append((keycode, mask))
+                    any_grab = True
+            if any_grab:
+                self.bindings[keycode << 8 | base_mask] = action
+            else:
+                conflicts.append(hotkey)
+        if self.file_handler_fd is not None:
+            # sync() may have pulled events into xlib's buffer without leaving
+            # the socket readable.
+            self.tk_root.after_idle(self._on_display_readable)
+        self._registered_actions = actions
+        self._last_conflicts = conflicts
+        return list(conflicts)
+
+    def _dispatch_key_event(self, event):
+        state = event.state & MOD_STATE_MASK
+        action = self.bindings.get(event.detail << 8 | state)
+        if action is not None:
+            self.on_trigger(action, event.type == X.KeyPress)
+
+    def _drain_events(self, limit=HOTKEY_EVENT_BATCH):
+        handled = 0
+        held = None
+        while held is not None or (handled < limit and self.display.pending_events()):
+            if held is not None:
+                event, held = held, None
+            else:
+                event = self.display.next_event()
+            handled += 1
+            if event.type == X.MappingNotify:
+                self.display.refresh_keyboard_mapping(event)
+                self._keycode_cache.clear()
+                self._registered_actions = None
+                continue
+            if event.type not in (X.KeyPress, X.KeyRelease):
+                continue
+            if event.type == X.KeyRelease and self.display.pending_events():
+                # Auto-repeat sends a release immediately followed by a press of
+                # the same key; drop the pair so held hotkeys stay "pressed".
+                follow = self.display.next_event()
+                if (
+                    follow.type == X.KeyPress
+                    and follow.detail == event.detail
+                    and 0 <= follow.time - event.time <= HOTKEY_REPEAT_WINDOW_MS
+                ):
+                    handled += 1
+                    continue
+                held = follow
+            self._dispatch_key_event(event)
+        return handled >= limit
 
     def _loop(self):
-        while self.running and self.display:
-            try:
-                while self.display.pending_events():
-                    event = self.display.next_event()
-                    if event.type not in (X.KeyPress, X.KeyRelease):
-                        continue
-                    state = event.state & (X.ShiftMask | X.ControlMask | X.Mod1Mask | X.Mod4Mask)
-                    action = self.bindings.get((event.detail, state))
-                    if action is not None:
-                        self.on_trigger(action, event.type == X.KeyPress)
-                time.sleep(0.02)
-            except Exception:
-                time.sleep(0.1)
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(self.display.fileno(), selectors.EVENT_READ)
+            sel.register(self._wake_r, selectors.EVENT_READ)
+        except Exception:
+            sel.close()
+            return
+        try:
+            while self.running and self.display:
+                try:
+                    # Events may already sit in xlib's buffer, so drain before blocking.
+                    more = self._drain_events()
+                    if not self.running:
+                        break
+                    sel.select(timeout=0 if more else None)
+                except Exception:
+                    if not self.running:
+                        break
+                    time.sleep(0.1)
+        finally:
+            sel.close()
 
 
 class AudioRouter:
@@ -202,112 +477,266 @@ class AudioRouter:
         self.source_module_id = None
         self.monitor_module_id = None
         self.mic_loop_module_id = None
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        self._subscribe_process = None
+        self._subscribe_thread = None
+        self._lock = threading.RLock()
+        self._pactl_env = self._build_pactl_env()
+        self._pulse = None
+        self._pulse_lock = threading.Lock()
+
+    @staticmethod
+    def _build_pactl_env():
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key in PACTL_ENV_KEYS or key.startswith("PULSE_")
+        }
+        # Output is parsed by label ("Default Source:"), so keep it untranslated.
+        env["LC_ALL"] = "C"
+        return env
 
     def _run(self, cmd):
-        return subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_pulse(cmd) if PULSECTL_AVAILABLE else None
+        if result is None:
+            if cmd[0] is None:
+                return subprocess.CompletedProcess(cmd, 127, "", "pactl not found")
+            result = subprocess.run(cmd, capture_output=True, text=True, close_fds=False, env=self._pactl_env)
+        if len(cmd) > 1 and cmd[0] == PACTL and cmd[1] in ("load-module", "unload-module"):
+            self.invalidate_cache()
+        return result
+
+    def _run_pulse(self, cmd):
+        # None means "use pactl": no equivalent here or no server connection.
+        args = tuple(cmd[1:])
+        with self._pulse_lock:
+            for _attempt in range(2):
+                try:
+                    if self._pulse is None:
+                        self._pulse = pulsectl.Pulse(APP_NAME)
+                    output = self._pulse_command(self._pulse, args)
+                except pulsectl.PulseDisconnected:
+                    self._close_pulse()
+                    continue
+                except (pulsectl.PulseError, ValueError) as exc:
+                    if self._pulse is None:
+                        return None
+                    return subprocess.CompletedProcess(cmd, 1, "", str(exc) or "PulseAudio request failed")
+                if output is None:
+                    return None
+                return subprocess.CompletedProcess(cmd, 0, output, "")
+        return None
+
+    @staticmethod
+    def _pulse_command(pulse, args):
+        if args == ("list", "short", "modules"):
+            return "".join(f"{m.index}\t{m.name}\t{m.argument or ''}\n" for m in pulse.module_list())
+        if args == ("list", "short", "sources"):
+            return "".join(f"{s.index}\t{s.name}\t{s.driver}\n" for s in pulse.source_list())
+        if args == ("list", "short", "sinks"):
+            return "".join(f"{s.index}\t{s.name}\t{s.driver}\n" for s in pulse.sink_list())
+        if args == ("info",):
+            info = pulse.server_info()
+            return (
+                f"Server Name: {info.server_name}\n"
+                f"Default Sink: {info.default_sink_name}\n"
+                f"Default Source: {info.default_source_name}\n"
+            )
+        if len(args) >= 2 and args[0] == "load-module":
+            return f"{pulse.module_load(args[1], ' '.join(args[2:]))}\n"
+        if len(args) == 2 and args[0] == "unload-module":
+            pulse.module_unload(int(args[1]))
+            return ""
+        if len(args) == 3 and args[0] == "set-source-mute":
+            pulse.source_mute(pulse.get_source_by_name(args[1]).index, args[2] == "1")
+            return ""
+        return None
+
+    def _close_pulse(self):
+        if self._pulse is not None:
+            with contextlib.suppress(Exception):
+                self._pulse.close()
+            self._pulse = None
+
+    def close(self):
+        self.stop_event_watch()
+        with self._pulse_lock:
+            self._close_pulse()
+
+    def _cached_run(self, cmd, ttl=PACTL_LIST_TTL):
+        key = tuple(cmd)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            generation = self._cache_generation
+        if cached and (self.events_active() or now - cached[0] < ttl):
+            return cached[1]
+        result = self._run(cmd)
+        if result.returncode == 0:
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    self._cache[key] = (now, result)
+        return result
+
+    def prefetch(self, *keys):
+        threads = [
+            threading.Thread(target=self._cached_run, args=(PACTL_EVENT_KEYS[key],), daemon=True) for key in keys
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def invalidate_cache(self, key=None):
+        with self._cache_lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+            self._cache_generation += 1
+
+    def events_active(self):
+        proc = self._subscribe_process
+        return proc is not None and proc.poll() is None
+
+    def start_event_watch(self):
+        if self.events_active() or not PACTL:
+            return False
+        try:
+            proc = subprocess.Popen(
+                [PACTL, "subscribe"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                close_fds=False,
+                env=self._pactl_env,
+            )
+        except Exception:
+            return False
+        self._subscribe_process = proc
+        self.invalidate_cache()
+        self._subscribe_thread = threading.Thread(target=self._watch_events, args=(proc,), daemon=True)
+        self._subscribe_thread.start()
+        return True
+
+    def stop_event_watch(self):
+        proc = self._subscribe_process
+        self._subscribe_process = None
+        if proc and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        self.invalidate_cache()
+
+    def _watch_events(self, proc):
+        try:
+            for line in proc.stdout:
+                parts = line.split()
+                if len(parts) < 4 or parts[0] != "Event":
+                    continue
+                key = PACTL_EVENT_KEYS.get(parts[3])
+                if key:
+                    self.invalidate_cache(key)
+        except Exception:
+            pass
+        self.invalidate_cache()
 
     def _module_id_by_name(self, module_name, arg_token=None):
-        result = self._run(["pactl", "list", "short", "modules"])
+        result = self._cached_run([PACTL, "list", "short", "modules"])
         if result.returncode != 0:
             return None
-
-        for line in result.stdout.splitlines():
-            parts = line.split("\t")
-            if len(parts) < 3:
-                continue
-            mod_id, mod_name, mod_args = parts[0], parts[1], parts[2]
-            if mod_name != module_name:
-                continue
-            if arg_token is None:
-                return mod_id
-            if arg_token in mod_args:
+        for mod_id, mod_args in _index_modules(result.stdout).get(module_name, ()):
+            if arg_token is None or arg_token in mod_args:
                 return mod_id
         return None
 
     def ensure_virtual_mic(self):
-        self.sink_module_id = self._module_id_by_name("module-null-sink", f"sink_name={SINK_NAME}")
-        if not self.sink_module_id:
-            sink_cmd = [
-                "pactl",
-                "load-module",
-                "module-null-sink",
-                f"sink_name={SINK_NAME}",
-                "sink_properties=device.description=SoundpadSink",
-            ]
-            sink_result = self._run(sink_cmd)
-            if sink_result.returncode != 0:
-                return False, sink_result.stderr.strip() or sink_result.stdout.strip()
-            self.sink_module_id = sink_result.stdout.strip()
-
-        self.source_module_id = self._module_id_by_name("module-remap-source", f"source_name={SOURCE_NAME}")
-        if not self.source_module_id:
-            source_cmd = [
-                "pactl",
-                "load-module",
-                "module-remap-source",
-                f"master={SINK_NAME}.monitor",
-                f"source_name={SOURCE_NAME}",
-                "source_properties=device.description=SoundpadMic",
-            ]
-            source_result = self._run(source_cmd)
-            if source_result.returncode != 0:
-                return False, source_result.stderr.strip() or source_result.stdout.strip()
-            self.source_module_id = source_result.stdout.strip()
-
-        return True, f"Ready: sink={SINK_NAME}, mic={SOURCE_NAME}"
+        with self._lock:
+            self.sink_module_id = self._module_id_by_name("module-null-sink", f"sink_name={SINK_NAME}")
+            if not self.sink_module_id:
+                sink_cmd = [
+                    PACTL,
+                    "load-module",
+                    "module-null-sink",
+                    f"sink_name={SINK_NAME}",
+                    "sink_properties=device.description=SoundpadSink",
+                ]
+                sink_result = self._run(sink_cmd)
+                if sink_result.returncode != 0:
+                    return False, sink_result.stderr.strip() or sink_result.stdout.strip()
+                self.sink_module_id = sink_result.stdout.strip()
+
+            self.source_module_id = self._module_id_by_name("module-remap-source", f"source_name={SOURCE_NAME}")
+            if not self.source_module_id:
+                source_cmd = [
+                    PACTL,
+                    "load-module",
+                    "module-remap-source",
+                    f"master={SINK_NAME}.monitor",
+                    f"source_name={SOURCE_NAME}",
+                    "source_properties=device.description=SoundpadMic",
+                ]
+                source_result = self._run(source_cmd)
+                if source_result.returncode != 0:
+                    return False, source_result.stderr.strip() or source_result.stdout.strip()
+                self.source_module_id = source_result.stdout.strip()
+
+            return True, f"Ready: sink={SINK_NAME}, mic={SOURCE_NAME}"
 
     def ensure_local_monitor(self):
-        self.monitor_module_id = self._module_id_by_name("module-loopback", f"source={SINK_NAME}.monitor")
-        if self.monitor_module_id:
-            return True, "Local monitor ready"
-
-        monitor_cmd = [
-            "pactl",
-            "load-module",
-            "module-loopback",
-            f"source={SINK_NAME}.monitor",
-            "sink=@DEFAULT_SINK@",
-            "latency_msec=30",
-        ]
-        monitor_result = self._run(monitor_cmd)
-        if monitor_result.returncode != 0:
-            return False, monitor_result.stderr.strip() or monitor_result.stdout.strip()
-        self.monitor_module_id = monitor_result.stdout.strip()
-        return True, "Local monitor enabled"
+        with self._lock:
+            self.monitor_module_id = self._module_id_by_name("module-loopback", f"source={SINK_NAME}.monitor")
+            if self.monitor_module_id:
+                return True, "Local monitor ready"
+
+            monitor_cmd = [
+                PACTL,
+                "load-module",
+                "module-loopback",
+                f"source={SINK_NAME}.monitor",
+                "sink=@DEFAULT_SINK@",
+                "latency_msec=30",
+            ]
+            monitor_result = self._run(monitor_cmd)
+            if monitor_result.returncode != 0:
+                return False, monitor_result.stderr.strip() or monitor_result.stdout.strip()
+            self.monitor_module_id = monitor_result.stdout.strip()
+            return True, "Local monitor enabled"
 
     def unload_monitor(self):
-        if not self.monitor_module_id:
-            return True, "Speaker monitor already disabled"
-        unload_result = self._run(["pactl", "unload-module", str(self.monitor_module_id)])
-        if unload_result.returncode != 0:
-            return False, unload_result.stderr.strip() or unload_result.stdout.strip()
-        self.monitor_module_id = None
-        return True, "Speaker monitor muted"
+        with self._lock:
+            if not self.monitor_module_id:
+                return True, "Speaker monitor already disabled"
+            unload_result = self._run([PACTL, "unload-module", str(self.monitor_module_id)])
+            if unload_result.returncode != 0:
+                return False, unload_result.stderr.strip() or unload_result.stdout.strip()
+            self.monitor_module_id = None
+            return True, "Speaker monitor muted"
 
     def set_mic_mute(self, muted):
         mute_value = "1" if muted else "0"
-        result = self._run(["pactl", "set-source-mute", SOURCE_NAME, mute_value])
+        result = self._run([PACTL, "set-source-mute", SOURCE_NAME, mute_value])
         if result.returncode != 0:
             return False, result.stderr.strip() or result.stdout.strip()
         return True, "Mic muted" if muted else "Mic unmuted"
 
     def list_input_sources(self):
-        result = self._run(["pactl", "list", "short", "sources"])
+        result = self._cached_run([PACTL, "list", "short", "sources"])
         if result.returncode != 0:
             return []
         names = []
-        for line in result.stdout.splitlines():
-            parts = line.split("\t")
-            if len(parts) < 2:
-                continue
-            source_name = parts[1].strip()
+        for _source_id, source_name, _driver in _PACTL_ROW.findall(result.stdout):
             if source_name == SOURCE_NAME or source_name.endswith(".monitor"):
                 continue
             names.append(source_name)
         return names
 
     def get_default_source(self):
-        result = self._run(["pactl", "info"])
+        result = self._cached_run([PACTL, "info"])
         if result.returncode != 0:
             return ""
         for line in result.stdout.splitlines():
@@ -316,51 +745,363 @@ class AudioRouter:
         return ""
 
     def _find_mic_loop_module(self):
-        result = self._run(["pactl", "list", "short", "modules"])
+        result = self._cached_run([PACTL, "list", "short", "modules"])
         if result.returncode != 0:
             return None
-        for line in result.stdout.splitlines():
-            parts = line.split("\t")
-            if len(parts) < 3:
-                continue
-            mod_id, mod_name, mod_args = parts[0], parts[1], parts[2]
-            if mod_name != "module-loopback":
-                continue
+        for mod_id, mod_args in _index_modules(result.stdout).get("module-loopback", ()):
             if f"sink={SINK_NAME}" in mod_args and "source=soundpad_sink.monitor" not in mod_args:
                 return mod_id
         return None
 
     def connect_input_source_to_soundpad(self, source_name):
-        current = self._find_mic_loop_module()
-        if current:
-            unload = self._run(["pactl", "unload-module", str(current)])
-            if unload.returncode != 0:
-                return False, unload.stderr.strip() or unload.stdout.strip()
+        with self._lock:
+            current = self._find_mic_loop_module()
+            if current:
+                unload = self._run([PACTL, "unload-module", str(current)])
+                if unload.returncode != 0:
+                    return False, unload.stderr.strip() or unload.stdout.strip()
+                self.mic_loop_module_id = None
+
+            cmd = [
+                PACTL,
+                "load-module",
+                "module-loopback",
+                f"source={source_name}",
+                f"sink={SINK_NAME}",
+                "latency_msec=20",
+            ]
+            result = self._run(cmd)
+            if result.returncode != 0:
+                return False, result.stderr.strip() or result.stdout.strip()
+            self.mic_loop_module_id = result.stdout.strip()
+            return True, f"Mic source connected: {source_name}"
+
+    def disconnect_input_source_from_soundpad(self):
+        with self._lock:
+            module_id = self._find_mic_loop_module()
+            if not module_id:
+                return True, "Mic source already disconnected"
+            result = self._run([PACTL, "unload-module", str(module_id)])
+            if result.returncode != 0:
+                return False, result.stderr.strip() or result.stdout.strip()
             self.mic_loop_module_id = None
+            return True, "Mic source disconnected"
+
+
+class MpvPlayer:
+    def __init__(self, on_finished=None):
+        self.on_finished = on_finished
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+        self.socket_path = os.path.join(runtime_dir, f"arch-soundpad-mpv-{os.getpid()}.sock")
+        self.process = None
+        self.sock = None
+        self.reader = None
+        self.lock = threading.Lock()
+        self.playing = False
+        self.awaiting_start = False
+        self.last_error = ""
 
+    def start(self):
+        mpv = shutil.which("mpv")
+        if not mpv:
+            return False
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
         cmd = [
-            "pactl",
-            "load-module",
-            "module-loopback",
-            f"source={source_name}",
-            f"sink={SINK_NAME}",
-            "latency_msec=20",
+            mpv,
+            "--no-config",
+            "--idle=yes",
+            "--no-terminal",
+            "--no-video",
+            "--volume-max=200",
+            f"--audio-device=pulse/{SINK_NAME}",
+            f"--input-ipc-server={self.socket_path}",
         ]
-        result = self._run(cmd)
-        if result.returncode != 0:
-            return False, result.stderr.strip() or result.stdout.strip()
-        self.mic_loop_module_id = result.stdout.strip()
-        return True, f"Mic source connected: {source_name}"
+        try:
+            self.process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+            )
+        except Exception:
+            self.process = None
+            return False
+        deadline = time.monotonic() + MPV_CONNECT_TIMEOUT
+        while time.monotonic() < deadline and self.process.poll() is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                time.sleep(0.05)
+                continue
+            self.sock = sock
+            self.reader = threading.Thread(target=self._read_events, args=(sock,), daemon=True)
+            self.reader.start()
+            return True
+        self.close()
+        return False
 
-    def disconnect_input_source_from_soundpad(self):
-        module_id = self._find_mic_loop_module()
-        if not module_id:
-            return True, "Mic source already disconnected"
-        result = self._run(["pactl", "unload-module", str(module_id)])
-        if result.returncode != 0:
-            return False, result.stderr.strip() or result.stdout.strip()
-        self.mic_loop_module_id = None
-        return True, "Mic source disconnected"
+    def alive(self):
+        return self.sock is not None and self.process is not None and self.process.poll() is None
+
+    def _send(self, *command):
+        if not self.alive():
+            return False
+        line = json.dumps({"command": list(command)}) + "\n"
+        try:
+            self.sock.sendall(line.encode("utf-8"))
+        except OSError:
+            return False
+        return True
+
+    def _read_events(self, sock):
+        buffer = b""
+        while True:
+            try:
+                chunk = sock.recv(4096)
+            except OSError:
+                break
+            if not chunk:
+                break
+            buffer += chunk
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                self._handle_event(message)
+        with self.lock:
+            was_playing = self.playing
+            self.playing = False
+            self.awaiting_start = False
+        if was_playing:
+            self._notify_finished()
+
+    def _handle_event(self, message):
+        event = message.get("event")
+        finished = False
+        with self.lock:
+            if event == "start-file":
+                self.awaiting_start = False
+            elif event == "end-file" and not self.awaiting_start and self.playing:
+                # With loadfile "replace" the previous file ends after the new
+                # play was requested; ignore that until the new file starts.
+                self.playing = False
+                finished = True
+                if message.get("reason") == "error":
+                    self.last_error = message.get("file_error") or "mpv could not play the file."
+        if finished:
+            self._notify_finished()
+
+    def _notify_finished(self):
+        if self.on_finished is not None:
+            self.on_finished()
+
+    def play(self, path, volume, loop):
+        with self.lock:
+            self.playing = True
+            self.awaiting_start = True
+            self.last_error = ""
+        # mpv's volume is cubic; map the linear slider so it matches ffmpeg.
+        ok = (
+            self._send("set_property", "volume", 100.0 * (volume / 100.0) ** (1.0 / 3.0))
+            and self._send("set_property", "loop-file", "inf" if loop else "no")
+            and self._send("loadfile", path, "replace")
+        )
+        if not ok:
+            with self.lock:
+                self.playing = False
+                self.awaiting_start = False
+        return ok
+
+    def stop(self):
+        with self.lock:
+            self.playing = False
+            self.awaiting_start = False
+        self._send("stop")
+
+    def is_playing(self):
+        with self.lock:
+            return self.playing
+
+    def take_error(self):
+        with self.lock:
+            err, self.last_error = self.last_error, ""
+        return err
+
+    def close(self):
+        self._send("quit")
+        if self.sock:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+        if self.process and self.process.poll() is None:
+            try:
+                self.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+class StreamPlayer:
+    # The worker thread owns the stream; pa_simple is not safe to share.
+    def __init__(self, on_finished=None):
+        self.on_finished = on_finished
+        self.stream = None
+        self.worker = None
+        self.lock = threading.Lock()
+        self.wake = threading.Condition(self.lock)
+        self.request = None
+        self.generation = 0
+        self.playing = False
+        self.closed = False
+        self.last_error = ""
+        self.av = None
+        self.numpy = None
+
+    def start(self):
+        try:
+            import av
+            import numpy
+            import pasimple
+        except Exception:
+            return False
+        self.av = av
+        self.numpy = numpy
+        buffer_bytes = STREAM_RATE * STREAM_CHANNELS * 4 * STREAM_BUFFER_MS // 1000
+        try:
+            self.stream = pasimple.PaSimple(
+                pasimple.PA_STREAM_PLAYBACK,
+                pasimple.PA_SAMPLE_FLOAT32LE,
+                STREAM_CHANNELS,
+                STREAM_RATE,
+                app_name=APP_NAME,
+                stream_name="clip",
+                device_name=SINK_NAME,
+                tlength=buffer_bytes,
+            )
+        except Exception:
+            self.stream = None
+            return False
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+        return True
+
+    def alive(self):
+        return self.stream is not None and self.worker is not None and self.worker.is_alive()
+
+    def _run(self):
+        while True:
+            with self.lock:
+                while self.request is None and not self.closed:
+                    self.wake.wait()
+                if self.closed:
+                    return
+                path, volume, loop = self.request
+                self.request = None
+                generation = self.generation
+            error = ""
+            try:
+                completed = self._play_file(path, volume / 100.0, loop, generation)
+            except Exception as exc:
+                completed = True
+                error = str(exc) or "Could not decode the file."
+            if not completed:
+                with contextlib.suppress(Exception):
+                    self.stream.flush()
+                continue
+            with contextlib.suppress(Exception):
+                self.stream.drain()
+            with self.lock:
+                current = generation == self.generation
+                if current:
+                    self.playing = False
+                    self.last_error = error
+            if current:
+                self._notify_finished()
+
+    def _play_file(self, path, gain, loop, generation):
+        av = self.av
+        while True:
+            with av.open(path) as container:
+                resampler = av.AudioResampler(format="flt", layout="stereo", rate=STREAM_RATE)
+                for frame in container.decode(audio=0):
+                    for out in resampler.resample(frame):
+                        if generation != self.generation:
+                            return False
+                        self._write(out.to_ndarray(), gain)
+                for out in resampler.resample(None):
+                    self._write(out.to_ndarray(), gain)
+            if not loop or generation != self.generation:
+                return generation == self.generation
+
+    def _write(self, samples, gain):
+        if gain != 1.0:
+            numpy = self.numpy
+            samples = samples * numpy.float32(gain)
+            if gain > 1.0:
+                numpy.clip(samples, -1.0, 1.0, out=samples)
+        self.stream.write(samples.tobytes())
+
+    def _notify_finished(self):
+        if self.on_finished is not None:
+            self.on_finished()
+
+    def play(self, path, volume, loop):
+        if not self.alive():
+            return False
+        with self.lock:
+            self.request = (path, volume, loop)
+            self.generation += 1
+            self.playing = True
+            self.last_error = ""
+            self.wake.notify()
+        return True
+
+    def stop(self):
+        with self.lock:
+            self.request = None
+            self.generation += 1
+            self.playing = False
+            self.wake.notify()
+
+    def is_playing(self):
+        with self.lock:
+            return self.playing
+
+    def take_error(self):
+        with self.lock:
+            err, self.last_error = self.last_error, ""
+        return err
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.request = None
+            self.generation += 1
+            self.playing = False
+            self.wake.notify()
+        if self.worker is not None:
+            self.worker.join(timeout=1)
+            if self.worker.is_alive():
+                return
+        self.worker = None
+        if self.stream is not None:
+            with contextlib.suppress(Exception):
+                self.stream.close()
+            self.stream = None
 
 
 class SoundpadApp(tk.Tk):
@@ -371,20 +1112,35 @@ class SoundpadApp(tk.Tk):
         self.minsize(520, 320)
 
         self.router = AudioRouter()
+        # One worker, so a PTT release can never overtake its press.
+        self._audio_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._closing = False
         self.player_process = None
+        self._player_pidfd = None
+        self._player_stderr = None
+        self._stderr_reader = None
+        self._ffmpeg_path = shutil.which("ffmpeg")
+        self.clip_player = None
+        self.clip_playback = False
 
         self.profiles = {}
+        self._sorted_names = None
+        # name -> (file name, digest, serialized clip list) of what is on disk
+        self._profile_files = {}
+        self._dirty_profiles = set()
         self.active_profile_name = "Default"
         self.clips = []
         self.selected_index = None
-        self.bound_hotkeys = []
+        self._hotkey_table = {}
+        self._hotkey_to_index = {}
+        self._rendered_rows = []
         self.current_profile_name = tk.StringVar(value="Default")
         self.selected_input_source = tk.StringVar(value="")
         self.global_hotkeys_enabled = tk.BooleanVar(value=True)
         self.push_to_talk_enabled = tk.BooleanVar(value=False)
         self.ptt_hotkey = tk.StringVar(value="Ctrl+Alt+M")
         self.global_hotkeys_active = False
-        self.global_hotkeys = GlobalHotkeyManager(self._on_global_hotkey)
+        self.global_hotkeys = GlobalHotkeyManager(self._on_global_hotkey, self)
         self.last_hotkey_conflicts = []
         self.ptt_pressed = False
 
@@ -393,16 +1149,35 @@ class SoundpadApp(tk.Tk):
         self.loop_enabled = tk.BooleanVar(value=False)
         self.mic_muted = False
         self.speakers_muted = True
+        self._last_profiles_digest = None
+        self._last_backup_ts = None
+        self._backup_layout = None
+        self._backup_owed = False
+        self._last_settings_digest = None
+        self._save_after_id = None
+        self._settings_after_id = None
+        self._rebind_after_id = None
 
         self._load_settings()
-        self._load_profiles()
+        loaded = {}
+        reader = threading.Thread(target=self._read_profiles_bg, args=(loaded,), daemon=True)
+        reader.start()
         self._build_ui()
+        reader.join()
+        if "error" in loaded:
+            raise loaded["error"]
+        self._install_profiles(loaded.get("result"))
         self._refresh_profile_selector()
         self._refresh_listbox()
         self._bind_hotkeys()
         self._setup_audio_router()
 
     def _build_ui(self):
+        self.withdraw()
+        style = ttk.Style(self)
+        style.configure("SpTitle.TLabel", font=("DejaVu Sans", 14, "bold"))
+        style.configure("SpSectionTitle.TLabel", font=("DejaVu Sans", 13, "bold"))
+        style.configure("SpField.TLabel", font=("DejaVu Sans", 11))
         root = ttk.Frame(self, padding=12)
         root.pack(fill=tk.BOTH, expand=True)
 
@@ -462,7 +1237,7 @@ class SoundpadApp(tk.Tk):
         ttk.Button(profile_row, text="Rename", command=self.rename_profile).pack(side=tk.LEFT, padx=(6, 0))
         ttk.Button(profile_row, text="Delete", command=self.delete_profile).pack(side=tk.LEFT, padx=(6, 0))
 
-        title = ttk.Label(left_panel, text="Sound Clips", font=("DejaVu Sans", 14, "bold"))
+        title = ttk.Label(left_panel, text="Sound Clips", style="SpTitle.TLabel")
         title.pack(anchor="w", pady=(0, 6))
 
         list_frame = ttk.Frame(left_panel)
@@ -492,10 +1267,10 @@ class SoundpadApp(tk.Tk):
         ttk.Button(btn_frame, text="Set Hotkey", command=self.set_selected_hotkey).pack(side=tk.LEFT, padx=(20, 0))
         ttk.Button(btn_frame, text="Clear Hotkey", command=self.clear_selected_hotkey).pack(side=tk.LEFT, padx=(8, 0))
 
-        right_title = ttk.Label(right_panel, text="Controls", font=("DejaVu Sans", 13, "bold"))
+        right_title = ttk.Label(right_panel, text="Controls", style="SpSectionTitle.TLabel")
         right_title.pack(anchor="w")
 
-        ttk.Label(right_panel, text="Volume", font=("DejaVu Sans", 11)).pack(anchor="w", pady=(14, 4))
+        ttk.Label(right_panel, text="Volume", style="SpField.TLabel").pack(anchor="w", pady=(14, 4))
         ttk.Scale(right_panel, from_=0, to=200, variable=self.volume, orient=tk.HORIZONTAL).pack(fill=tk.X)
         ttk.Label(right_panel, text="0% to 200%", foreground="#666").pack(anchor="w")
 
@@ -510,37 +1285,25 @@ class SoundpadApp(tk.Tk):
         self.speakers_mute_button = ttk.Button(right_panel, text="Unmute Speakers", command=self.toggle_speakers_mute)
         self.speakers_mute_button.pack(anchor="w", fill=tk.X)
 
-        ttk.Label(right_panel, text="Mic Input Source", font=("DejaVu Sans", 11)).pack(anchor="w", pady=(16, 4))
+        ttk.Label(right_panel, text="Mic Input Source", style="SpField.TLabel").pack(anchor="w", pady=(16, 4))
         self.mic_source_combo = ttk.Combobox(
             right_panel,
             textvariable=self.selected_input_source,
             state="readonly",
         )
         self.mic_source_combo.pack(anchor="w", fill=tk.X)
-        ttk.Button(right_panel, text="Refresh Sources", command=self.refresh_input_sources).pack(anchor="w", fill=tk.X, pady=(6, 0))
+        ttk.Button(right_panel, text="Refresh Sources", command=lambda: self.refresh_input_sources(force=True)).pack(anchor="w", fill=tk.X, pady=(6, 0))
         ttk.Button(right_panel, text="Connect Mic To Soundpad", command=self.connect_selected_input_source).pack(anchor="w", fill=tk.X, pady=(6, 0))
         ttk.Button(right_panel, text="Disconnect Mic From Soundpad", command=self.disconnect_input_source).pack(anchor="w", fill=tk.X, pady=(6, 0))
-        ttk.Label(right_panel, text="Profiles", font=("DejaVu Sans", 11)).pack(anchor="w", pady=(16, 4))
+        ttk.Label(right_panel, text="Profiles", style="SpField.TLabel").pack(anchor="w", pady=(16, 4))
         ttk.Button(right_panel, text="Export Profiles", command=self.export_profiles).pack(anchor="w", fill=tk.X)
         ttk.Button(right_panel, text="Import Profiles", command=self.import_profiles).pack(anchor="w", fill=tk.X, pady=(6, 0))
         ttk.Button(right_panel, text="Restore Backup", command=self.restore_backup).pack(anchor="w", fill=tk.X, pady=(6, 0))
         ttk.Button(right_panel, text="Diagnostics", command=self.show_diagnostics).pack(anchor="w", fill=tk.X, pady=(6, 0))
 
-        info = (
-            "Shortcuts:\n"
-            "  Enter: Play\n"
-            "  Delete: Remove\n"
-            "  Alt+\\: Stop\n"
-            "  Set per-clip key: Set Hotkey\n"
-            "  If Alt+1 fails in dwm, use Ctrl+Alt+1"
-        )
-        ttk.Label(right_panel, text=info, justify=tk.LEFT, foreground="#444").pack(anchor="w", pady=(16, 0))
+        ttk.Label(right_panel, text=INFO_TEXT, justify=tk.LEFT, foreground="#444").pack(anchor="w", pady=(16, 0))
 
-        source_hint = (
-            f"Set input device in apps to:\n"
-            f"{SOURCE_NAME}"
-        )
-        ttk.Label(right_panel, text=source_hint, justify=tk.LEFT, foreground="#125").pack(anchor="w", pady=(16, 0))
+        ttk.Label(right_panel, text=SOURCE_HINT, justify=tk.LEFT, foreground="#125").pack(anchor="w", pady=(16, 0))
 
         status_bar = ttk.Label(self, textvariable=self.status_text, anchor="w", relief=tk.SUNKEN, padding=(8, 4))
         status_bar.pack(fill=tk.X, side=tk.BOTTOM)
@@ -548,25 +1311,47 @@ class SoundpadApp(tk.Tk):
         self.bind("<Return>", lambda _e: self.play_selected())
         self.bind("<Delete>", lambda _e: self.remove_selected())
         self.bind("<Alt-backslash>", lambda _e: self.stop_playback())
+        self.bind_all("<Key>", self._dispatch_hotkey)
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.after(100, self._init_global_hotkeys)
+        self.update_idletasks()
+        self.deiconify()
 
-    def _bind_hotkeys(self):
-        for seq in self.bound_hotkeys:
-            self.unbind_all(seq)
-        self.bound_hotkeys = []
-
+    def _bind_hotkeys(self, debounce=False):
+        table = {}
+        owners = {}
         for idx, clip in enumerate(self.clips):
             hotkey_label = clip.get("hotkey", "").strip()
             if not hotkey_label:
                 continue
-            sequence = self._hotkey_to_tk_sequence(hotkey_label)
-            if not sequence:
+            owners.setdefault(hotkey_label.lower(), idx)
+            key = self._hotkey_to_tk_key(hotkey_label)
+            if key is None:
                 continue
-            self.bind_all(sequence, lambda _e, clip_idx=idx: self.play_index(clip_idx))
-            self.bound_hotkeys.append(sequence)
+            table[key] = idx
+        self._hotkey_table = table
+        self._hotkey_to_index = owners
+        # Edits that move clip indices regrab now so no grab plays a stale index.
+        if debounce:
+            self._schedule_global_rebind()
+        else:
+            self._register_global_hotkeys()
+
+    def _schedule_global_rebind(self):
+        if self._rebind_after_id is not None:
+            self.after_cancel(self._rebind_after_id)
+        self._rebind_after_id = self.after(HOTKEY_REBIND_MS, self._do_global_rebind)
+
+    def _do_global_rebind(self):
+        self._rebind_after_id = None
         self._register_global_hotkeys()
 
+    def _dispatch_hotkey(self, event):
+        key = (event.state & TK_MODIFIER_MASK, event.keysym.lower())
+        idx = self._hotkey_table.get(key)
+        if idx is not None:
+            self.play_index(idx)
+
     def _init_global_hotkeys(self):
         if not self.global_hotkeys_enabled.get():
             return
@@ -580,6 +1365,9 @@ class SoundpadApp(tk.Tk):
         self._register_global_hotkeys()
 
     def _register_global_hotkeys(self):
+        if self._rebind_after_id is not None:
+            self.after_cancel(self._rebind_after_id)
+            self._rebind_after_id = None
         if not self.global_hotkeys_active:
             return
         entries = []
@@ -615,33 +1403,53 @@ class SoundpadApp(tk.Tk):
             self.status_text.set("Global hotkeys disabled")
 
     def _on_global_hotkey(self, action, pressed):
+        if threading.current_thread() is not threading.main_thread():
+            self.after(0, self._on_global_hotkey, action, pressed)
+            return
         if action == "__stop__" and pressed:
-            self.after(0, self.stop_playback)
+            self.stop_playback()
             return
         if action == "__ptt__":
             if pressed:
-                self.after(0, self._ptt_press)
+                self._ptt_press()
             else:
-                self.after(0, self._ptt_release)
+                self._ptt_release()
             return
         if pressed:
-            self.after(0, lambda: self.play_index(action))
+            self.play_index(action)
 
-    def _ensure_selected_source_connected(self):
-        source_name = self.selected_input_source.get().strip()
-        if not source_name:
-            return False, "No input source selected"
-        ok, msg = self.router.connect_input_source_to_soundpad(source_name)
-        if ok:
-            self._save_settings()
-        return ok, msg
+    def _submit_audio(self, func, on_done, *args):
+        future = self._audio_executor.submit(func, *args)
+        if on_done is not None:
+            future.add_done_callback(lambda done: self._deliver_audio_result(on_done, done))
+        return future
+
+    def _deliver_audio_result(self, on_done, future):
+        try:
+            result = future.result()
+        except Exception as exc:
+            result = (False, str(exc))
+        if self._closing:
+            return
+        try:
+            self.after(0, on_done, result)
+        except (RuntimeError, tk.TclError):
+            pass
 
     def _ptt_press(self):
         if not self.push_to_talk_enabled.get() or self.ptt_pressed:
             return
         self.ptt_pressed = True
-        ok, msg = self._ensure_selected_source_connected()
+        source_name = self.selected_input_source.get().strip()
+        if not source_name:
+            self._ptt_press_done((False, "No input source selected"))
+            return
+        self._submit_audio(self.router.connect_input_source_to_soundpad, self._ptt_press_done, source_name)
+
+    def _ptt_press_done(self, result):
+        ok, msg = result
         if ok:
+            self._schedule_settings_save()
             self.status_text.set("PTT active")
         else:
             self.status_text.set("PTT failed")
@@ -651,7 +1459,10 @@ class SoundpadApp(tk.Tk):
         if not self.ptt_pressed:
             return
         self.ptt_pressed = False
-        ok, msg = self.router.disconnect_input_source_from_soundpad()
+        self._submit_audio(self.router.disconnect_input_source_from_soundpad, self._ptt_release_done)
+
+    def _ptt_release_done(self, result):
+        ok, msg = result
         if ok:
             self.status_text.set("PTT released")
         else:
@@ -659,38 +1470,108 @@ class SoundpadApp(tk.Tk):
             messagebox.showerror("Push-to-talk failed", msg)
 
     def _setup_audio_router(self):
-        if not shutil.which("pactl"):
+        if not PACTL:
             self.status_text.set("Error: pactl not found. Install pipewire-pulse or pulseaudio.")
             return
-
-        ok, msg = self.router.ensure_virtual_mic()
+        self.status_text.set("Connecting audio...")
+        preferred = self.selected_input_source.get().strip()
+        push_to_talk = bool(self.push_to_talk_enabled.get())
+        threading.Thread(
+            target=self._setup_audio_router_bg,
+            args=(preferred, push_to_talk),
+            daemon=True,
+        ).start()
+
+    def _setup_audio_router_bg(self, preferred, push_to_talk):
+        router = self.router
+        router.start_event_watch()
+        result = {"ok": False, "warnings": [], "sources": [], "selected": None, "route": None}
+        ok, msg = router.ensure_virtual_mic()
+        result["ok"] = ok
+        result["message"] = msg
         if ok:
-            ok_mute, mute_msg = self.router.unload_monitor()
+            ok_mute, mute_msg = router.unload_monitor()
+            result["speakers_muted"] = ok_mute
             if not ok_mute:
-                self.status_text.set(msg)
-                messagebox.showwarning("Speaker mute default failed", mute_msg)
-            else:
-                self.status_text.set(f"{msg} | Speakers muted by default")
-        else:
+                result["warnings"].append(("Speaker mute default failed", mute_msg))
+            warming = router.prefetch("source")
+            ok_mic, mic_msg = router.set_mic_mute(False)
+            if not ok_mic:
+                result["warnings"].append(("Mic control unavailable", mic_msg))
+            for thread in warming:
+                thread.join()
+            sources = router.list_input_sources()
+            result["sources"] = sources
+            if preferred not in sources:
+                preferred = sources[0] if sources else ""
+            chosen = preferred or router.get_default_source().strip()
+            if chosen and chosen in sources:
+                result["selected"] = chosen
+                if not push_to_talk:
+                    result["route"] = router.connect_input_source_to_soundpad(chosen)
+            for player_cls in (MpvPlayer, StreamPlayer):
+                player = player_cls(on_finished=self._on_clip_finished_bg)
+                if player.start():
+                    result["player"] = player
+                    break
+        if not self._closing:
+            try:
+                self.after(0, self._finish_audio_setup, result)
+                return
+            except (RuntimeError, tk.TclError):
+                pass
+        player = result.get("player")
+        if player is not None:
+            player.close()
+
+    def _finish_audio_setup(self, result):
+        if self._closing:
+            if result.get("player") is not None:
+                result["player"].close()
+            return
+        if not result["ok"]:
             self.status_text.set("Audio setup failed")
-            messagebox.showerror("Audio setup failed", msg)
+            messagebox.showerror("Audio setup failed", result["message"])
             return
+        if result.get("speakers_muted"):
+            self.status_text.set(f"{result['message']} | Speakers muted by default")
+        else:
+            self.status_text.set(result["message"])
+        for title, warning in result["warnings"]:
+            messagebox.showwarning(title, warning)
+        self.clip_player = result.get("player")
 
-        ok_mic, mic_msg = self.router.set_mic_mute(False)
-        if not ok_mic:
-            messagebox.showwarning("Mic control unavailable", mic_msg)
-        self.refresh_input_sources()
-        self.auto_connect_default_input_source()
         self.ptt_hotkey_label.configure(text=f"PTT key: {self.ptt_hotkey.get()}")
+        sources = result["sources"]
+        self.mic_source_combo["values"] = sources
+        chosen = result["selected"]
+        if not chosen:
+            if self.selected_input_source.get() not in sources:
+                self.selected_input_source.set(sources[0] if sources else "")
+            return
+        self.selected_input_source.set(chosen)
+        if result["route"] is None:
+            self._schedule_settings_save()
+            self._register_global_hotkeys()
+            self.status_text.set("Push-to-talk ready")
+            return
+        ok_route, route_msg = result["route"]
+        if ok_route:
+            self._schedule_settings_save()
+            self.status_text.set(route_msg)
+        else:
+            messagebox.showwarning("Mic route warning", route_msg)
 
     def _load_settings(self):
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         if not SETTINGS_FILE.exists():
             return
         try:
-            data = json.loads(SETTINGS_FILE.read_text())
+            raw = SETTINGS_FILE.read_bytes()
+            data = _load_json(raw)
         except Exception:
             return
+        self._last_settings_digest = _payload_digest(raw)
         if isinstance(data, dict):
             source_name = str(data.get("input_source", "")).strip()
             if source_name:
@@ -709,17 +1590,35 @@ class SoundpadApp(tk.Tk):
             "push_to_talk_enabled": bool(self.push_to_talk_enabled.get()),
             "ptt_hotkey": self.ptt_hotkey.get().strip(),
         }
-        SETTINGS_FILE.write_text(json.dumps(data, indent=2))
+        payload = _dump_json(data)
+        digest = _payload_digest(payload)
+        if digest == self._last_settings_digest:
+            return
+        _atomic_write(SETTINGS_FILE, payload)
+        self._last_settings_digest = digest
 
     @staticmethod
     def _normalize_clip(clip):
         if not isinstance(clip, dict) or "path" not in clip:
             return None
-        path = str(clip.get("path", "")).strip()
+        if len(clip) == 3:
+            label, path, hotkey = clip.get("label"), clip["path"], clip.get("hotkey")
+            if (
+                type(label) is str
+                and type(path) is str
+                and type(hotkey) is str
+                and label
+                and path
+                and label == label.strip()
+                and path == path.strip()
+                and hotkey == hotkey.strip()
+            ):
+                return clip
+        path = _as_str(clip.get("path")).strip()
         if not path:
             return None
-        label = str(clip.get("label", "")).strip() or Path(path).stem
-        hotkey = str(clip.get("hotkey", "")).strip()
+        label = _as_str(clip.get("label")).strip() or _clip_stem(path)
+        hotkey = _as_str(clip.get("hotkey")).strip()
         return {"label": label, "path": path, "hotkey": hotkey}
 
     @staticmethod
@@ -756,38 +1655,141 @@ class SoundpadApp(tk.Tk):
             current_name = "Default"
 
         if current_name not in profiles:
-            current_name = sorted(profiles.keys())[0]
+            current_name = min(profiles)
         return profiles, current_name
 
-    def _load_profiles(self):
+    def _read_profiles_bg(self, loaded):
+        try:
+            loaded["result"] = self._read_profiles()
+        except Exception as exc:
+            loaded["error"] = exc
+
+    def _read_profiles(self):
+        # Runs on the startup reader thread: no Tk calls and no writes to self.
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        if not CONFIG_FILE.exists():
+        files = {}
+        index_digest = None
+        if PROFILE_INDEX_FILE.exists():
+            data, files, index_digest = self._read_profile_files()
+        elif CONFIG_FILE.exists():
+            try:
+                data = _load_json(CONFIG_FILE.read_bytes())
+            except Exception:
+                data = None
+        else:
+            return None
+        profiles, current_name = self._parse_profiles_payload(data)
+        return profiles, current_name, files, index_digest
+
+    def _install_profiles(self, result):
+        if result is None:
             self.profiles = {"Default": []}
+            self._sorted_names = None
             self.current_profile_name.set("Default")
             self.clips = self.profiles["Default"]
             return
 
-        try:
-            data = json.loads(CONFIG_FILE.read_text())
-        except Exception:
-            data = None
-
-        profiles, current_name = self._parse_profiles_payload(data)
+        profiles, current_name, self._profile_files, self._last_profiles_digest = result
         self.profiles = profiles
+        self._sorted_names = None
         self.active_profile_name = current_name
         self.current_profile_name.set(current_name)
         self.clips = self.profiles[current_name]
 
+    def _read_profile_files(self):
+        files = {}
+        try:
+            raw_index = PROFILE_INDEX_FILE.read_bytes()
+            index = _load_json(raw_index)
+        except Exception:
+            return None, files, None
+        if not isinstance(index, dict) or not isinstance(index.get("profiles"), dict):
+            return None, files, None
+        profiles = {}
+        for name, filename in index["profiles"].items():
+            if not isinstance(name, str) or not isinstance(filename, str):
+                continue
+            try:
+                raw = (PROFILES_DIR / filename).read_bytes()
+                profiles[name] = _load_json(raw)
+            except Exception:
+                continue
+            files[name] = (filename, _payload_digest(raw), raw)
+        data = {"current_profile": index.get("current_profile", "Default"), "profiles": profiles}
+        return data, files, _payload_digest(raw_index)
+
+    def _mark_all_profiles_dirty(self):
+        self._dirty_profiles.update(self.profiles)
+
     def _save_profiles(self):
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        data = {
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        changed = False
+        for name in [n for n in self._profile_files if n not in self.profiles]:
+            filename = self._profile_files.pop(name)[0]
+            try:
+                (PROFILES_DIR / filename).unlink()
+            except OSError:
+                pass
+            changed = True
+
+        for name, clips in self.profiles.items():
+            entry = self._profile_files.get(name)
+            if entry is not None and name not in self._dirty_profiles:
+                continue
+            payload = _dump_json(clips)
+            digest = _payload_digest(payload)
+            if entry is not None and entry[1] == digest:
+                continue
+            filename = entry[0] if entry is not None else _profile_filename(name)
+            _atomic_write(PROFILES_DIR / filename, payload)
+            self._profile_files[name] = (filename, digest, payload)
+            changed = True
+        self._dirty_profiles.clear()
+
+        index = {
             "current_profile": self.active_profile_name,
-            "profiles": self.profiles,
+            "profiles": {name: self._profile_files[name][0] for name in self.profiles},
         }
-        CONFIG_FILE.write_text(json.dumps(data, indent=2))
-        self._backup_profiles_snapshot(data)
+        index_payload = _dump_json(index)
+        index_digest = _payload_digest(index_payload)
+        if index_digest != self._last_profiles_digest:
+            _atomic_write(PROFILE_INDEX_FILE, index_payload)
+            self._last_profiles_digest = index_digest
+            changed = True
+        if changed:
+            self._backup_owed = True
+        # Snapshot at most every BACKUP_INTERVAL, except when profiles were
+        # added, removed or renamed; _flush_save writes any snapshot still owed.
+        if self._backup_owed and (
+            self._last_backup_ts is None
+            or time.monotonic() - self._last_backup_ts >= BACKUP_INTERVAL
+            or self._profile_layout() != self._backup_layout
+        ):
+            self._write_backup()
+
+    def _profile_layout(self):
+        return tuple((name, self._profile_files[name][0]) for name in self.profiles)
+
+    def _write_backup(self):
+        self._backup_profiles_snapshot(self._snapshot_payload())
+        self._backup_owed = False
+        self._last_backup_ts = time.monotonic()
+        self._backup_layout = self._profile_layout()
+
+    def _snapshot_payload(self):
+        entries = [
+            json.dumps(name).encode("utf-8") + b": " + self._profile_files[name][2]
+            for name in self.profiles
+        ]
+        return (
+            b'{"current_profile": '
+            + json.dumps(self.active_profile_name).encode("utf-8")
+            + b', "profiles": {'
+            + b", ".join(entries)
+            + b"}}"
+        )
 
-    def _backup_profiles_snapshot(self, data):
+    def _backup_profiles_snapshot(self, payload):
         BACKUP_DIR.mkdir(parents=True, exist_ok=True)
         timestamp = time.strftime("%Y%m%d-%H%M%S")
         backup_path = BACKUP_DIR / f"profiles-{timestamp}.json"
@@ -795,26 +1797,65 @@ class SoundpadApp(tk.Tk):
         while backup_path.exists():
             backup_path = BACKUP_DIR / f"profiles-{timestamp}-{index}.json"
             index += 1
-        backup_path.write_text(json.dumps(data, indent=2))
+        _atomic_write(backup_path, payload)
 
-        backups = sorted(BACKUP_DIR.glob("profiles-*.json"))
-        max_backups = 50
-        for old in backups[:-max_backups]:
+        with os.scandir(BACKUP_DIR) as entries:
+            backups = sorted(
+                entry.path for entry in entries if entry.name.startswith("profiles-") and entry.name.endswith(".json")
+            )
+        for old in backups[:-MAX_BACKUPS]:
             try:
-                old.unlink()
-            except Exception:
+                os.unlink(old)
+            except OSError:
                 pass
 
     def _save_clips(self):
         current = self.active_profile_name or "Default"
-        self.profiles[current] = self.clips
+        if self.profiles.get(current) is not self.clips:
+            if current not in self.profiles:
+                self._sorted_names = None
+            self.profiles[current] = self.clips
+        self._dirty_profiles.add(current)
         self._save_profiles()
 
+    def _schedule_save(self):
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(SAVE_DEBOUNCE_MS, self._do_save)
+
+    def _do_save(self):
+        self._save_after_id = None
+        self._save_clips()
+
+    def _schedule_settings_save(self):
+        if self._settings_after_id is not None:
+            self.after_cancel(self._settings_after_id)
+        self._settings_after_id = self.after(SAVE_DEBOUNCE_MS, self._do_save_settings)
+
+    def _do_save_settings(self):
+        self._settings_after_id = None
+        self._save_settings()
+
+    def _flush_save(self):
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._do_save()
+        if self._backup_owed:
+            self._write_backup()
+        if self._settings_after_id is not None:
+            self.after_cancel(self._settings_after_id)
+            self._do_save_settings()
+
+    def _profile_names(self):
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self.profiles)
+        return self._sorted_names
+
     def _refresh_profile_selector(self):
-        names = sorted(self.profiles.keys())
+        names = self._profile_names()
         self.profile_combo["values"] = names
         current = self.active_profile_name
-        if current not in names and names:
+        if current not in self.profiles and names:
             current = names[0]
             self.active_profile_name = current
             self.current_profile_name.set(current)
@@ -830,22 +1871,27 @@ class SoundpadApp(tk.Tk):
             return
         self.switch_profile(target)
 
+    def _after_profile_change(self):
+        self._schedule_save()
+        self._refresh_profile_selector()
+        self._refresh_listbox()
+        self._bind_hotkeys()
+
     def switch_profile(self, name):
         target = name.strip()
         if target not in self.profiles:
             return
         self.stop_playback()
         current = self.active_profile_name
-        if current in self.profiles:
-            self.profiles[current] = self.clips
+        if current in self.profiles and self._save_after_id is not None:
+            # The pending save only writes the active profile; keep the
+            # edits made to the one being left.
+            self._dirty_profiles.add(current)
         self.active_profile_name = target
         self.current_profile_name.set(target)
         self.clips = self.profiles[target]
         self.selected_index = None
-        self._save_profiles()
-        self._refresh_profile_selector()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+        self._after_profile_change()
         self.status_text.set(f"Switched profile: {target}")
 
     def create_profile(self):
@@ -859,6 +1905,7 @@ class SoundpadApp(tk.Tk):
             messagebox.showerror("Profile exists", f"Profile '{profile}' already exists.")
             return
         self.profiles[profile] = []
+        self._sorted_names = None
         self.switch_profile(profile)
 
     def rename_profile(self):
@@ -875,13 +1922,11 @@ class SoundpadApp(tk.Tk):
             messagebox.showerror("Profile exists", f"Profile '{new_name}' already exists.")
             return
         self.profiles[new_name] = self.profiles.pop(old)
+        self._sorted_names = None
         self.active_profile_name = new_name
         self.current_profile_name.set(new_name)
         self.clips = self.profiles[new_name]
-        self._save_profiles()
-        self._refresh_profile_selector()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+        self._after_profile_change()
         self.status_text.set(f"Renamed profile to: {new_name}")
 
     def delete_profile(self):
@@ -894,15 +1939,13 @@ class SoundpadApp(tk.Tk):
         if not messagebox.askyesno("Delete profile", f"Delete profile '{name}'?"):
             return
         del self.profiles[name]
-        next_name = sorted(self.profiles.keys())[0]
+        self._sorted_names = None
+        next_name = self._profile_names()[0]
         self.active_profile_name = next_name
         self.current_profile_name.set(next_name)
         self.clips = self.profiles[next_name]
         self.selected_index = None
-        self._save_profiles()
-        self._refresh_profile_selector()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+        self._after_profile_change()
         self.status_text.set(f"Deleted profile: {name}")
 
     def export_profiles(self):
@@ -920,7 +1963,7 @@ class SoundpadApp(tk.Tk):
             "profiles": self.profiles,
         }
         try:
-            Path(out_path).write_text(json.dumps(payload, indent=2))
+            _atomic_write(out_path, _dump_json(payload))
         except Exception as exc:
             messagebox.showerror("Export failed", str(exc))
             return
@@ -934,7 +1977,7 @@ class SoundpadApp(tk.Tk):
         if not in_path:
             return
         try:
-            data = json.loads(Path(in_path).read_text())
+            data = _load_json(Path(in_path).read_bytes())
             imported_profiles, imported_current = self._parse_profiles_payload(data)
         except Exception as exc:
             messagebox.showerror("Import failed", f"Invalid file: {exc}")
@@ -946,6 +1989,8 @@ class SoundpadApp(tk.Tk):
         )
         if replace:
             self.profiles = imported_profiles
+            self._sorted_names = None
+            self._mark_all_profiles_dirty()
             self.active_profile_name = imported_current
         else:
             for name, clips in imported_profiles.items():
@@ -955,16 +2000,14 @@ class SoundpadApp(tk.Tk):
                     target = f"{name}-{suffix}"
                     suffix += 1
                 self.profiles[target] = clips
+            self._sorted_names = None
             if self.active_profile_name not in self.profiles:
-                self.active_profile_name = sorted(self.profiles.keys())[0]
+                self.active_profile_name = self._profile_names()[0]
 
         self.current_profile_name.set(self.active_profile_name)
         self.clips = self.profiles[self.active_profile_name]
         self.selected_index = None
-        self._save_profiles()
-        self._refresh_profile_selector()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+        self._after_profile_change()
         self.status_text.set(f"Imported profiles from: {Path(in_path).name}")
 
     def restore_backup(self):
@@ -977,7 +2020,7 @@ class SoundpadApp(tk.Tk):
         if not in_path:
             return
         try:
-            data = json.loads(Path(in_path).read_text())
+            data = _load_json(Path(in_path).read_bytes())
             restored_profiles, restored_current = self._parse_profiles_payload(data)
         except Exception as exc:
             messagebox.showerror("Restore failed", f"Invalid backup file: {exc}")
@@ -985,23 +2028,58 @@ class SoundpadApp(tk.Tk):
 
         self.stop_playback()
         self.profiles = restored_profiles
+        self._sorted_names = None
+        self._mark_all_profiles_dirty()
         self.active_profile_name = restored_current
         self.current_profile_name.set(self.active_profile_name)
         self.clips = self.profiles[self.active_profile_name]
         self.selected_index = None
-        self._save_profiles()
-        self._refresh_profile_selector()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+        self._after_profile_change()
         self.status_text.set(f"Restored backup: {Path(in_path).name}")
 
-    def _refresh_listbox(self):
-        self.listbox.delete(0, tk.END)
-        for idx, clip in enumerate(self.clips, start=1):
-            label = clip.get("label") or Path(clip["path"]).stem
-            hotkey = clip.get("hotkey", "").strip()
-            hotkey_txt = f" [{hotkey}]" if hotkey else ""
-            self.listbox.insert(tk.END, f"{idx:02d}. {label}{hotkey_txt}")
+    @staticmethod
+    def _format_row(idx, clip):
+        label = clip.get("label") or _clip_stem(clip["path"])
+        hotkey = clip.get("hotkey", "").strip()
+        hotkey_txt = f" [{hotkey}]" if hotkey else ""
+        return f"{idx:02d}. {label}{hotkey_txt}"
+
+    def _refresh_listbox(self, changed_indices=None):
+        if changed_indices is None:
+            rows = [self._format_row(idx, clip) for idx, clip in enumerate(self.clips, start=1)]
+            self.listbox.delete(0, tk.END)
+            if rows:
+                self.listbox.insert(tk.END, *rows)
+            self._rendered_rows = rows
+            return
+        listbox = self.listbox
+        clips = self.clips
+        rendered = self._rendered_rows
+        format_row = self._format_row
+        limit = min(len(clips), len(rendered))
+        for idx in sorted(changed_indices):
+            if idx < 0 or idx >= limit:
+                continue
+            row = format_row(idx + 1, clips[idx])
+            if row == rendered[idx]:
+                continue
+            selected = listbox.selection_includes(idx)
+            listbox.delete(idx)
+            listbox.insert(idx, row)
+            if selected:
+                listbox.selection_set(idx)
+            rendered[idx] = row
+
+    def _remove_listbox_row(self, index):
+        listbox = self.listbox
+        selected = [idx - 1 for idx in listbox.curselection() if idx > index]
+        rows = [self._format_row(idx, clip) for idx, clip in enumerate(self.clips[index:], start=index + 1)]
+        listbox.delete(index, tk.END)
+        if rows:
+            listbox.insert(index, *rows)
+        self._rendered_rows[index:] = rows
+        for idx in selected:
+            listbox.selection_set(idx)
 
     def _on_select(self, _event):
         sel = self.listbox.curselection()
@@ -1010,32 +2088,34 @@ class SoundpadApp(tk.Tk):
     def add_clips(self):
         file_paths = filedialog.askopenfilenames(
             title="Select audio files",
-            filetypes=[
-                ("Audio files", "*.wav *.mp3 *.flac *.ogg *.m4a *.aac *.opus"),
-                ("All files", "*.*"),
-            ],
+            filetypes=AUDIO_FILETYPES,
         )
         if not file_paths:
             return
 
+        start = len(self.clips)
+        new_clips = []
         for path in file_paths:
-            p = str(Path(path).expanduser())
-            label = Path(p).stem
-            self.clips.append({"label": label, "path": p, "hotkey": ""})
-
-        self._save_clips()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+            p = os.path.expanduser(path)
+            label = _clip_stem(p)
+            new_clips.append({"label": label, "path": p, "hotkey": ""})
+        self.clips.extend(new_clips)
+
+        self._schedule_save()
+        rows = [self._format_row(idx, clip) for idx, clip in enumerate(new_clips, start=start + 1)]
+        self.listbox.insert(tk.END, *rows)
+        self._rendered_rows.extend(rows)
         self.status_text.set(f"Added {len(file_paths)} clip(s)")
 
     def remove_selected(self):
         if self.selected_index is None:
             return
 
-        del self.clips[self.selected_index]
+        removed = self.selected_index
+        del self.clips[removed]
         self.selected_index = None
-        self._save_clips()
-        self._refresh_listbox()
+        self._schedule_save()
+        self._remove_listbox_row(removed)
         self._bind_hotkeys()
         self.status_text.set("Removed clip")
 
@@ -1058,44 +2138,41 @@ class SoundpadApp(tk.Tk):
         clip = self.clips[self.selected_index]
         clip_path = clip["path"]
 
-        if not Path(clip_path).exists():
+        if not os.access(clip_path, os.F_OK):
             self.status_text.set("Clip file missing")
             messagebox.showerror("File not found", clip_path)
             return
 
-        if not shutil.which("ffmpeg"):
+        volume = max(0, min(200, int(self.volume.get())))
+        label = clip.get("label") or os.path.basename(clip_path)
+
+        if self.clip_player and self.clip_player.alive():
+            self._stop_player_process()
+            if self.clip_player.play(clip_path, volume, bool(self.loop_enabled.get())):
+                self.clip_playback = True
+                self.status_text.set(f"Playing: {label}")
+                return
+
+        if not self._ffmpeg_path:
+            self._ffmpeg_path = shutil.which("ffmpeg")
+        if not self._ffmpeg_path:
             self.status_text.set("Error: ffmpeg not found")
             messagebox.showerror("Missing dependency", "Install ffmpeg")
             return
 
         self.stop_playback()
 
-        volume = max(0, min(200, int(self.volume.get())))
-        vol_filter = f"volume={volume / 100:.2f}"
-
+        loop_args = FFMPEG_ARGS_LOOP if self.loop_enabled.get() else ()
         cmd = [
-            "ffmpeg",
-            "-nostdin",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-y",
+            self._ffmpeg_path,
+            *FFMPEG_ARGS_HEAD,
+            *loop_args,
+            "-i",
+            clip_path,
+            "-filter:a",
+            f"volume={volume * 0.01:.2f}",
+            *FFMPEG_ARGS_TAIL,
         ]
-        if self.loop_enabled.get():
-            cmd.extend(["-stream_loop", "-1"])
-        cmd.extend(
-            [
-                "-i",
-                clip_path,
-                "-filter:a",
-                vol_filter,
-                "-f",
-                "pulse",
-                "-device",
-                SINK_NAME,
-                "out",
-            ]
-        )
 
         try:
             self.player_process = subprocess.Popen(
@@ -1103,15 +2180,65 @@ class SoundpadApp(tk.Tk):
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
+                close_fds=False,
             )
         except Exception as exc:
             self.status_text.set("Failed to play clip")
             messagebox.showerror("Playback error", str(exc))
             return
 
-        label = clip.get("label") or Path(clip_path).name
+        self._player_stderr = collections.deque(maxlen=PLAYER_STDERR_LINES)
+        self._stderr_reader = threading.Thread(
+            target=self._drain_stderr,
+            args=(self.player_process.stderr, self._player_stderr),
+            daemon=True,
+        )
+        self._stderr_reader.start()
         self.status_text.set(f"Playing: {label}")
-        self.after(300, self._poll_player)
+        self._watch_player_exit(self.player_process)
+
+    @staticmethod
+    def _drain_stderr(stream, buffer):
+        try:
+            for line in iter(stream.readline, ""):
+                buffer.append(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            with contextlib.suppress(OSError):
+                stream.close()
+
+    def _watch_player_exit(self, process):
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None or not hasattr(self.tk, "createfilehandler"):
+            self.after(300, self._poll_player)
+            return
+        try:
+            pidfd = pidfd_open(process.pid)
+        except OSError:
+            self.after(300, self._poll_player)
+            return
+        self._close_player_pidfd()
+        self._player_pidfd = pidfd
+        self.tk.createfilehandler(pidfd, tk.READABLE, lambda _fd, _mask: self._on_player_exit(process))
+
+    def _close_player_pidfd(self):
+        if self._player_pidfd is None:
+            return
+        try:
+            self.tk.deletefilehandler(self._player_pidfd)
+        except Exception:
+            pass
+        try:
+            os.close(self._player_pidfd)
+        except OSError:
+            pass
+        self._player_pidfd = None
+
+    def _on_player_exit(self, process):
+        self._close_player_pidfd()
+        if process is self.player_process:
+            self._poll_player()
 
     def _poll_player(self):
         if not self.player_process:
@@ -1120,12 +2247,9 @@ class SoundpadApp(tk.Tk):
             self.after(300, self._poll_player)
             return
         if self.player_process.returncode not in (0, None):
-            err = ""
-            if self.player_process.stderr:
-                try:
-                    err = self.player_process.stderr.read().strip()
-                except Exception:
-                    err = ""
+            if self._stderr_reader is not None:
+                self._stderr_reader.join(timeout=0.2)
+            err = "".join(self._player_stderr or ()).strip()
             self.status_text.set("Playback failed")
             if err:
                 messagebox.showerror("Playback failed", err)
@@ -1136,7 +2260,25 @@ class SoundpadApp(tk.Tk):
         self.player_process = None
         self.status_text.set("Idle")
 
-    def stop_playback(self):
+    def _on_clip_finished_bg(self):
+        try:
+            self.after(0, self._on_clip_finished)
+        except RuntimeError:
+            pass
+
+    def _on_clip_finished(self):
+        if not self.clip_playback or not self.clip_player or self.clip_player.is_playing():
+            return
+        self.clip_playback = False
+        err = self.clip_player.take_error()
+        if err:
+            self.status_text.set("Playback failed")
+            messagebox.showerror("Playback failed", err)
+            return
+        self.status_text.set("Idle")
+
+    def _stop_player_process(self):
+        self._close_player_pidfd()
         if self.player_process and self.player_process.poll() is None:
             self.player_process.terminate()
             try:
@@ -1144,11 +2286,20 @@ class SoundpadApp(tk.Tk):
             except subprocess.TimeoutExpired:
                 self.player_process.kill()
         self.player_process = None
+
+    def stop_playback(self):
+        self._stop_player_process()
+        if self.clip_playback and self.clip_player:
+            self.clip_player.stop()
+        self.clip_playback = False
         self.status_text.set("Stopped")
 
     def toggle_mic_mute(self):
         target = not self.mic_muted
-        ok, msg = self.router.set_mic_mute(target)
+        self._submit_audio(self.router.set_mic_mute, lambda result: self._mic_mute_done(target, result), target)
+
+    def _mic_mute_done(self, target, result):
+        ok, msg = result
         if not ok:
             messagebox.showerror("Mic mute failed", msg)
             return
@@ -1158,10 +2309,11 @@ class SoundpadApp(tk.Tk):
 
     def toggle_speakers_mute(self):
         target = not self.speakers_muted
-        if target:
-            ok, msg = self.router.unload_monitor()
-        else:
-            ok, msg = self.router.ensure_local_monitor()
+        action = self.router.unload_monitor if target else self.router.ensure_local_monitor
+        self._submit_audio(action, lambda result: self._speakers_mute_done(target, result))
+
+    def _speakers_mute_done(self, target, result):
+        ok, msg = result
         if not ok:
             messagebox.showerror("Speaker mute failed", msg)
             return
@@ -1170,14 +2322,24 @@ class SoundpadApp(tk.Tk):
         self.status_text.set(msg)
 
     def _suggest_default_hotkey(self):
-        used = {clip.get("hotkey", "").strip().lower() for clip in self.clips if clip.get("hotkey")}
-        for i in range(1, 10):
-            candidate = f"Alt+{i}"
-            if candidate.lower() not in used:
-                return candidate
-        return ""
+        used = self._hotkey_to_index
+        return next((label for label, key in DEFAULT_HOTKEY_CANDIDATES if key not in used), "")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _hotkey_to_tk_key(hotkey_text):
+        parsed = parse_hotkey(hotkey_text)
+        if not parsed:
+            return None
+        mods, key_name = parsed
+        state = 0
+        for mod in mods:
+            state |= TK_MODIFIER_BITS[mod]
+        return state, key_name
 
-    def _hotkey_to_tk_sequence(self, hotkey_text):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _hotkey_to_tk_sequence(hotkey_text):
         raw = hotkey_text.strip()
         if not raw:
             return None
@@ -1187,17 +2349,10 @@ class SoundpadApp(tk.Tk):
         key_part = parts[-1]
         mods = []
         for mod in parts[:-1]:
-            lower = mod.lower()
-            if lower in ("ctrl", "control"):
-                mods.append("Control")
-            elif lower == "alt":
-                mods.append("Alt")
-            elif lower == "shift":
-                mods.append("Shift")
-            elif lower in ("super", "win", "mod4"):
-                mods.append("Mod4")
-            else:
+            canonical = HOTKEY_MODIFIER_ALIASES.get(mod.lower())
+            if canonical is None:
                 return None
+            mods.append(TK_SEQUENCE_MODIFIERS[canonical])
         if len(key_part) == 1:
             key_name = key_part.lower()
         else:
@@ -1218,27 +2373,26 @@ class SoundpadApp(tk.Tk):
         typed = simpledialog.askstring(
             "Set clip hotkey",
             "Enter key bind (examples: Alt+1, Ctrl+F, Shift+Alt+3)\nLeave empty to clear.",
-            initialvalue=current,
+            initialvalue=current or self._suggest_default_hotkey(),
             parent=self,
         )
         if typed is None:
             return
         typed = typed.strip()
+        changed = {self.selected_index}
         if typed:
             sequence = self._hotkey_to_tk_sequence(typed)
             if not sequence:
                 messagebox.showerror("Invalid hotkey", "Use formats like Alt+1, Ctrl+F, Super+1, Ctrl+Alt+1.")
                 return
-            for idx, other in enumerate(self.clips):
-                if idx == self.selected_index:
-                    continue
-                if other.get("hotkey", "").strip().lower() == typed.lower():
-                    other["hotkey"] = ""
-                    break
+            prev = self._hotkey_to_index.get(typed.lower())
+            if prev is not None and prev != self.selected_index:
+                self.clips[prev]["hotkey"] = ""
+                changed.add(prev)
         clip["hotkey"] = typed
-        self._save_clips()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+        self._schedule_save()
+        self._refresh_listbox(changed)
+        self._bind_hotkeys(debounce=True)
         self.status_text.set("Hotkey updated")
 
     def clear_selected_hotkey(self):
@@ -1248,13 +2402,24 @@ class SoundpadApp(tk.Tk):
                 return
             self.selected_index = sel[0]
         self.clips[self.selected_index]["hotkey"] = ""
-        self._save_clips()
-        self._refresh_listbox()
-        self._bind_hotkeys()
+        self._schedule_save()
+        self._refresh_listbox({self.selected_index})
+        self._bind_hotkeys(debounce=True)
         self.status_text.set("Hotkey cleared")
 
-    def refresh_input_sources(self):
-        sources = self.router.list_input_sources()
+    def refresh_input_sources(self, force=False):
+        self._submit_audio(self._list_sources_bg, self._refresh_sources_done, force)
+
+    def _list_sources_bg(self, force):
+        if force:
+            self.router.invalidate_cache()
+        return True, self.router.list_input_sources()
+
+    def _refresh_sources_done(self, result):
+        ok, sources = result
+        if not ok:
+            self.status_text.set(f"Source refresh failed: {sources}")
+            return
         self.mic_source_combo["values"] = sources
         if self.selected_input_source.get() in sources:
             return
@@ -1266,23 +2431,29 @@ class SoundpadApp(tk.Tk):
     def connect_selected_input_source(self):
         if self.push_to_talk_enabled.get():
             self.status_text.set("Push-to-talk is enabled; hold PTT key to route mic")
-            self._save_settings()
+            self._schedule_settings_save()
             self._register_global_hotkeys()
             return
         source_name = self.selected_input_source.get().strip()
         if not source_name:
             messagebox.showerror("No source selected", "Select a mic source first.")
             return
-        ok, msg = self.router.connect_input_source_to_soundpad(source_name)
+        self._submit_audio(self.router.connect_input_source_to_soundpad, self._connect_source_done, source_name)
+
+    def _connect_source_done(self, result):
+        ok, msg = result
         if not ok:
             messagebox.showerror("Mic route failed", msg)
             return
-        self._save_settings()
+        self._schedule_settings_save()
         self.status_text.set(msg)
 
     def disconnect_input_source(self):
         self.ptt_pressed = False
-        ok, msg = self.router.disconnect_input_source_from_soundpad()
+        self._submit_audio(self.router.disconnect_input_source_from_soundpad, self._disconnect_source_done)
+
+    def _disconnect_source_done(self, result):
+        ok, msg = result
         if not ok:
             messagebox.showerror("Mic route failed", msg)
             return
@@ -1290,22 +2461,38 @@ class SoundpadApp(tk.Tk):
 
     def auto_connect_default_input_source(self):
         chosen = self.selected_input_source.get().strip()
+        push_to_talk = bool(self.push_to_talk_enabled.get())
+        self._submit_audio(self._auto_connect_bg, self._auto_connect_done, chosen, push_to_talk)
+
+    def _auto_connect_bg(self, chosen, push_to_talk):
+        router = self.router
         if not chosen:
-            chosen = self.router.get_default_source().strip()
-        if not chosen:
+            for thread in router.prefetch("server", "source"):
+                thread.join()
+            chosen = router.get_default_source().strip()
+        if not chosen or chosen not in router.list_input_sources():
+            return True, None
+        if push_to_talk:
+            return True, (chosen, None)
+        return True, (chosen, router.connect_input_source_to_soundpad(chosen))
+
+    def _auto_connect_done(self, result):
+        ok, outcome = result
+        if not ok:
+            messagebox.showwarning("Mic route warning", outcome)
             return
-        available = set(self.router.list_input_sources())
-        if chosen not in available:
+        if outcome is None:
             return
+        chosen, route = outcome
         self.selected_input_source.set(chosen)
-        if self.push_to_talk_enabled.get():
-            self._save_settings()
+        if route is None:
+            self._schedule_settings_save()
             self._register_global_hotkeys()
             self.status_text.set("Push-to-talk ready")
             return
-        ok, msg = self.router.connect_input_source_to_soundpad(chosen)
-        if ok:
-            self._save_settings()
+        ok_route, msg = route
+        if ok_route:
+            self._schedule_settings_save()
             self.status_text.set(msg)
         else:
             messagebox.showwarning("Mic route warning", msg)
@@ -1314,7 +2501,7 @@ class SoundpadApp(tk.Tk):
         enabled = self.push_to_talk_enabled.get()
         self.ptt_pressed = False
         if enabled:
-            self.router.disconnect_input_source_from_soundpad()
+            self._submit_audio(self.router.disconnect_input_source_from_soundpad, None)
             if not self.global_hotkeys_enabled.get():
                 self.status_text.set("Push-to-talk enabled, but global hotkeys are off")
             else:
@@ -1322,7 +2509,7 @@ class SoundpadApp(tk.Tk):
         else:
             self.auto_connect_default_input_source()
             self.status_text.set("Push-to-talk disabled")
-        self._save_settings()
+        self._schedule_settings_save()
         self._register_global_hotkeys()
 
     def set_ptt_hotkey(self):
@@ -1342,19 +2529,21 @@ class SoundpadApp(tk.Tk):
             return
         self.ptt_hotkey.set(typed)
         self.ptt_hotkey_label.configure(text=f"PTT key: {typed}")
-        self._save_settings()
+        self._schedule_settings_save()
         self._register_global_hotkeys()
         self.status_text.set("PTT hotkey updated")
 
     def show_diagnostics(self):
-        pactl_ok = shutil.which("pactl") is not None
-        sinks = self.router._run(["pactl", "list", "short", "sinks"]).stdout if pactl_ok else ""
-        sources = self.router._run(["pactl", "list", "short", "sources"]).stdout if pactl_ok else ""
-        info = self.router._run(["pactl", "info"]).stdout if pactl_ok else ""
-        sink_ok = SINK_NAME in sinks
-        source_ok = SOURCE_NAME in sources
-        mic_loop = self.router._find_mic_loop_module() if pactl_ok else None
-        monitor_loop = self.router._module_id_by_name("module-loopback", f"source={SINK_NAME}.monitor") if pactl_ok else None
+        self._submit_audio(self._diagnostics_bg, self._diagnostics_done)
+
+    def _diagnostics_bg(self):
+        router = self.router
+        pactl_ok = PACTL is not None
+        sinks = router._run([PACTL, "list", "short", "sinks"]).stdout if pactl_ok else ""
+        sources = router._run([PACTL, "list", "short", "sources"]).stdout if pactl_ok else ""
+        info = router._run([PACTL, "info"]).stdout if pactl_ok else ""
+        mic_loop = router._find_mic_loop_module() if pactl_ok else None
+        monitor_loop = router._module_id_by_name("module-loopback", f"source={SINK_NAME}.monitor") if pactl_ok else None
 
         default_sink = ""
         default_source = ""
@@ -1363,7 +2552,21 @@ class SoundpadApp(tk.Tk):
                 default_sink = line.split(":", 1)[1].strip()
             if line.startswith("Default Source:"):
                 default_source = line.split(":", 1)[1].strip()
+        return True, {
+            "pactl_ok": pactl_ok,
+            "sink_ok": SINK_NAME in sinks,
+            "source_ok": SOURCE_NAME in sources,
+            "mic_loop": bool(mic_loop),
+            "monitor_loop": bool(monitor_loop),
+            "default_sink": default_sink,
+            "default_source": default_source,
+        }
 
+    def _diagnostics_done(self, result):
+        ok, audio = result
+        if not ok:
+            messagebox.showerror("Diagnostics failed", audio)
+            return
         text = (
             f"Active profile: {self.active_profile_name}\n"
             f"Profiles count: {len(self.profiles)}\n"
@@ -1375,21 +2578,33 @@ class SoundpadApp(tk.Tk):
             f"PTT key: {self.ptt_hotkey.get()}\n"
             f"PTT pressed: {self.ptt_pressed}\n"
             f"Selected input source: {self.selected_input_source.get() or 'none'}\n"
-            f"pactl available: {pactl_ok}\n"
-            f"Virtual sink present ({SINK_NAME}): {sink_ok}\n"
-            f"Virtual source present ({SOURCE_NAME}): {source_ok}\n"
-            f"Mic loop module active: {bool(mic_loop)}\n"
-            f"Speaker monitor module active: {bool(monitor_loop)}\n"
-            f"Default sink: {default_sink or 'unknown'}\n"
-            f"Default source: {default_source or 'unknown'}\n"
+            f"pactl available: {audio['pactl_ok']}\n"
+            f"Virtual sink present ({SINK_NAME}): {audio['sink_ok']}\n"
+            f"Virtual source present ({SOURCE_NAME}): {audio['source_ok']}\n"
+            f"Mic loop module active: {audio['mic_loop']}\n"
+            f"Speaker monitor module active: {audio['monitor_loop']}\n"
+            f"Default sink: {audio['default_sink'] or 'unknown'}\n"
+            f"Default source: {audio['default_source'] or 'unknown'}\n"
             f"Backups dir: {BACKUP_DIR}"
         )
         messagebox.showinfo("Diagnostics", text)
 
     def _on_close(self):
-        self._save_clips()
+        if self._rebind_after_id is not None:
+            self.after_cancel(self._rebind_after_id)
+            self._rebind_after_id = None
+        self._flush_save()
         self.stop_playback()
+        # Drop queued routing changes; the router lock orders a running one
+        # before the final disconnect. Waiting here could deadlock with a
+        # worker that is handing its result back through after().
+        self._closing = True
+        self._audio_executor.shutdown(wait=False, cancel_futures=True)
         self.router.disconnect_input_source_from_soundpad()
+        self.router.close()
+        if self.clip_player:
+            self.clip_player.close()
+            self.clip_player = None
         if self.global_hotkeys_active:
             self.global_hotkeys.stop()
             self.global_hotkeys_active = False
@@ -1399,7 +2614,10 @@ def main():
     if "--headless-check" in sys.argv:
         return run_headless_check()
     app = SoundpadApp()
-    app.mainloop()
+    try:
+        app.mainloop()
+    except KeyboardInterrupt:
+        app._on_close()
     return 0
 
 